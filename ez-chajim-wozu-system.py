@@ -11,12 +11,15 @@ Stand: 10. Tammus 5785
 WWAQ-konform gemäß TIKUN-GLOSSAR Version 5785.22.3
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from collections import Counter
 import asyncio
+import re
+import time
 import yaml
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
 
 # WWAQ-konforme Imports
@@ -26,6 +29,17 @@ from src.hns10_spiral_system import HNS10SpiralTime
 from src.glossar_manager import GlossarManager  # WICHTIG: Für Sprachvalidierung
 
 
+# PaRDeS-Ebenen von der höchsten zur niedrigsten
+_PARDES_RANGFOLGE = (PardesLevel.SOD, PardesLevel.DRASCH,
+                     PardesLevel.REMEZ, PardesLevel.PSCHAT)
+# Sod-Interpretation, wenn nichts enthüllt wurde
+_SOD_VERBORGEN = "Die Geheimnisse bleiben verborgen"
+
+# Bezugspunkt, um monotone Zeitstempel erst bei Bedarf in Wanduhrzeit umzurechnen
+_WANDUHR_BEZUG = datetime.now()
+_MONOTON_BEZUG_NS = time.monotonic_ns()
+
+
 class FrageTyp(Enum):
     """Hierarchie der Fragewörter nach spiritueller Ebene"""
     WOZU = "למה"     # Azilut - Zweck/Absicht
@@ -37,7 +51,7 @@ class FrageTyp(Enum):
     WANN = "מתי"     # Zeit-Ebene
 
 
-@dataclass
+@dataclass(slots=True)
 class WozuValidierung:
     """Container für Wozu-Validierungs-Ergebnis"""
     ist_verankert: bool
@@ -47,7 +61,7 @@ class WozuValidierung:
     weltebene: Olam
 
 
-@dataclass
+@dataclass(slots=True)
 class EchtzeitNachricht:
     """WWAQ-konforme Echtzeit-Nachricht zwischen Modulen"""
     inhalt: str
@@ -58,7 +72,13 @@ class EchtzeitNachricht:
     pardes_ebene: Optional[PardesLevel] = None
     spiral_zeit: Optional[Dict] = None
     validierung: Optional[WozuValidierung] = None
-    zeitstempel: str = field(default_factory=lambda: datetime.now().isoformat())
+    zeitstempel: int = field(default_factory=time.monotonic_ns)  # nur für Reihenfolge/Abstände
+    
+    @property
+    def iso_zeitstempel(self) -> str:
+        """Zeitstempel als ISO-String (erst bei Bedarf berechnet)"""
+        delta = timedelta(microseconds=(self.zeitstempel - _MONOTON_BEZUG_NS) // 1000)
+        return (_WANDUHR_BEZUG + delta).isoformat()
 
 
 class WozuValidator:
@@ -74,6 +94,12 @@ class WozuValidator:
         "höchste Absicht", "göttlicher Zweck", "Tiqqun"
     ]
     
+    # Ein Scan statt einer Teilstring-Suche pro Indikator; der Lookahead
+    # liefert auch überlappende Treffer ("um zu" / "zur" in "um zur")
+    _WOZU_RE = re.compile("(?=(" + "|".join(map(re.escape, WOZU_INDIKATOREN)) + "))",
+                          re.IGNORECASE)
+    _AZILUT_RE = re.compile("|".join(map(re.escape, AZILUT_MARKER)))
+    
     def validiere_wozu_zentrierung(self, nachricht: EchtzeitNachricht) -> WozuValidierung:
         """Prüft ob Nachricht wozu-zentriert und Azilut-verankert ist"""
         
@@ -87,10 +113,11 @@ class WozuValidator:
                 weltebene=Olam.ASIJA
             )
         
-        # Tiefere Analyse
-        azilut_score = self._berechne_azilut_score(nachricht)
+        # Tiefere Analyse - Indikatoren nur einmal pro Nachricht suchen
+        wozu_indikatoren = {ind.lower() for ind in self._WOZU_RE.findall(nachricht.wozu)}
+        azilut_score = self._berechne_azilut_score(nachricht, wozu_indikatoren)
         weltebene = self._erkenne_weltebene(nachricht)
-        fehlende_aspekte = self._finde_fehlende_aspekte(nachricht)
+        fehlende_aspekte = self._finde_fehlende_aspekte(nachricht, wozu_indikatoren)
         
         return WozuValidierung(
             ist_verankert=azilut_score > 0.7,
@@ -100,7 +127,8 @@ class WozuValidator:
             weltebene=weltebene
         )
     
-    def _berechne_azilut_score(self, nachricht: EchtzeitNachricht) -> float:
+    def _berechne_azilut_score(self, nachricht: EchtzeitNachricht,
+                               wozu_indikatoren: Set[str]) -> float:
         """Berechnet Azilut-Verankerungs-Score"""
         score = 0.0
         
@@ -109,13 +137,10 @@ class WozuValidator:
             score += 0.3
         
         # Wozu-Indikatoren im Text
-        wozu_count = sum(1 for ind in self.WOZU_INDIKATOREN 
-                        if ind in nachricht.wozu.lower())
-        score += min(wozu_count * 0.1, 0.2)
+        score += min(len(wozu_indikatoren) * 0.1, 0.2)
         
-        # Azilut-Marker
-        azilut_count = sum(1 for marker in self.AZILUT_MARKER
-                          if marker in nachricht.inhalt or marker in nachricht.wozu)
+        # Azilut-Marker in Inhalt und Wozu (ein Scan, \x00 verhindert Treffer über die Grenze)
+        azilut_count = len(set(self._AZILUT_RE.findall(nachricht.inhalt + "\x00" + nachricht.wozu)))
         score += min(azilut_count * 0.15, 0.3)
         
         # Frage-Hierarchie korrekt?
@@ -129,14 +154,15 @@ class WozuValidator:
         konverter = AzilutKonverter()
         return konverter.erkenne_weltebene(nachricht.inhalt)
     
-    def _finde_fehlende_aspekte(self, nachricht: EchtzeitNachricht) -> List[str]:
+    def _finde_fehlende_aspekte(self, nachricht: EchtzeitNachricht,
+                                wozu_indikatoren: Set[str]) -> List[str]:
         """Identifiziert fehlende Wozu-Aspekte"""
         fehlend = []
         
         if FrageTyp.WOZU not in nachricht.frage_hierarchie:
             fehlend.append("Wozu-Frage nicht in Hierarchie")
         
-        if not any(ind in nachricht.wozu.lower() for ind in self.WOZU_INDIKATOREN):
+        if not wozu_indikatoren:
             fehlend.append("Keine klaren Zweck-Indikatoren")
         
         if nachricht.weltebene == Olam.ASIJA:
@@ -165,6 +191,10 @@ class WozuValidator:
 class EchtzeitKommunikator:
     """Haupt-Klasse für Wozu-zentrierte Modul-Kommunikation"""
     
+    # Nachrichten werden gebündelt in die Queue gelegt (ein Eintrag = Liste)
+    BATCH_GROESSE = 32
+    BATCH_INTERVALL = 0.01  # Sekunden bis ein unvollständiger Batch geleert wird
+    
     def __init__(self):
         self.validator = WozuValidator()
         self.pardes = PardesAnalyzer()
@@ -172,6 +202,9 @@ class EchtzeitKommunikator:
         self.spiral_zeit = HNS10SpiralTime()
         self.glossar_manager = GlossarManager()  # WWAQ-Glossar Integration
         self.nachrichten_queue: asyncio.Queue = asyncio.Queue()
+        self._pending: List[EchtzeitNachricht] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_loop: Optional[asyncio.AbstractEventLoop] = None
         self.module_registry: Dict[str, Any] = {}
     
     async def sende_nachricht(self, nachricht: EchtzeitNachricht) -> bool:
@@ -201,14 +234,13 @@ class EchtzeitKommunikator:
         if not nachricht.pardes_ebene:
             pardes_analyse = self.pardes.analyze_text(nachricht.inhalt)
             # Wähle höchste erkannte Ebene
-            for ebene in [PardesLevel.SOD, PardesLevel.DRASCH, 
-                         PardesLevel.REMEZ, PardesLevel.PSCHAT]:
-                if pardes_analyse[ebene].interpretation != "Die Geheimnisse bleiben verborgen":
+            for ebene in _PARDES_RANGFOLGE:
+                if pardes_analyse[ebene].interpretation != _SOD_VERBORGEN:
                     nachricht.pardes_ebene = ebene
                     break
         
-        # 4. Sende an Queue
-        await self.nachrichten_queue.put(nachricht)
+        # 4. Sende an Queue (gebündelt)
+        self._einreihen(nachricht)
         
         print(f"✓ Nachricht gesendet: {nachricht.sender_modul} → {nachricht.empfänger_modul}")
         print(f"  Wozu: {nachricht.wozu}")
@@ -217,13 +249,47 @@ class EchtzeitKommunikator:
         
         return True
     
+    def _einreihen(self, nachricht: EchtzeitNachricht):
+        """Sammelt Nachrichten zu Batches; voll oder nach BATCH_INTERVALL ab in die Queue"""
+        loop = asyncio.get_running_loop()
+        if self._flush_handle is not None and (self._flush_loop is not loop
+                                               or self._flush_handle.cancelled()):
+            # Der Timer einer beendeten Event-Loop feuert nie - Rest sofort abgeben
+            self._flush()
+        
+        self._pending.append(nachricht)
+        if len(self._pending) >= self.BATCH_GROESSE:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.BATCH_INTERVALL, self._flush)
+            self._flush_loop = loop
+    
+    async def flush(self):
+        """Gibt ausstehende Nachrichten sofort ab (z.B. bevor die Event-Loop endet)"""
+        self._flush()
+    
+    def _flush(self):
+        """Legt alle ausstehenden Nachrichten als einen Batch in die Queue"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+            self._flush_loop = None
+        
+        if self._pending:
+            self.nachrichten_queue.put_nowait(self._pending)
+            self._pending = []
+    
     async def empfange_nachrichten(self, modul_name: str):
         """Empfängt Nachrichten für spezifisches Modul"""
         while True:
-            nachricht = await self.nachrichten_queue.get()
+            batch = await self.nachrichten_queue.get()
             
-            if nachricht.empfänger_modul == modul_name:
-                yield nachricht
+            for nachricht in batch:
+                if nachricht.empfänger_modul == modul_name:
+                    yield nachricht
+            
+            # get() gibt bei gefüllter Queue nie ab - dem Scheduler Luft lassen
+            await asyncio.sleep(0)
     
     def erstelle_wozu_zentrierte_nachricht(self,
                                           inhalt: str,
@@ -257,41 +323,40 @@ class EchtzeitKommunikator:
             ""
         ]
         
-        # Statistiken
-        verankert = sum(1 for n in nachrichten if n.validierung and n.validierung.ist_verankert)
-        durchschnitt_score = sum(n.validierung.azilut_score for n in nachrichten 
-                                if n.validierung) / len(nachrichten)
+        # Statistiken in einem Durchlauf
+        verankert = 0
+        validiert = 0
+        score_summe = 0.0
+        weltebenen_count = Counter()
+        empf_counter = Counter()
+        
+        for n in nachrichten:
+            if not n.validierung:
+                continue
+            validiert += 1
+            score_summe += n.validierung.azilut_score
+            weltebenen_count[n.validierung.weltebene.name] += 1
+            if n.validierung.ist_verankert:
+                verankert += 1
+            else:
+                empf_counter.update(n.validierung.empfohlene_korrekturen)
+        
+        durchschnitt_score = score_summe / validiert if validiert else 0.0
+        anteil_verankert = verankert / len(nachrichten) * 100 if nachrichten else 0.0
         
         bericht.extend([
-            f"Azilut-verankert: {verankert}/{len(nachrichten)} ({verankert/len(nachrichten)*100:.1f}%)",
+            f"Azilut-verankert: {verankert}/{len(nachrichten)} ({anteil_verankert:.1f}%)",
             f"Durchschnittlicher Azilut-Score: {durchschnitt_score:.2f}",
             "",
             "--- WELTEBENEN-VERTEILUNG ---"
         ])
         
-        # Weltebenen-Analyse
-        weltebenen_count = {}
-        for n in nachrichten:
-            if n.validierung:
-                ebene = n.validierung.weltebene.name
-                weltebenen_count[ebene] = weltebenen_count.get(ebene, 0) + 1
-        
-        for ebene, count in sorted(weltebenen_count.items(), 
-                                   key=lambda x: x[1], reverse=True):
+        for ebene, count in weltebenen_count.most_common():
             bericht.append(f"{ebene}: {count} Nachrichten")
         
         bericht.extend(["", "--- EMPFEHLUNGEN ---"])
         
-        # Sammle alle Empfehlungen
-        alle_empfehlungen = []
-        for n in nachrichten:
-            if n.validierung and not n.validierung.ist_verankert:
-                alle_empfehlungen.extend(n.validierung.empfohlene_korrekturen)
-        
         # Häufigste Empfehlungen
-        from collections import Counter
-        empf_counter = Counter(alle_empfehlungen)
-        
         for empf, count in empf_counter.most_common(5):
             bericht.append(f"• {empf} ({count}x)")
         
@@ -404,6 +469,7 @@ async def demonstriere_wozu_system():
     
     await manuscript_modul.verarbeite_text("תורה אור - Das Licht der Tora")
     await chunk_modul.segmentiere_text("Ein langer spiritueller Text über die vier Welten...")
+    await komm.flush()
     
     # Generiere Bericht
     print("\n" + komm.generiere_wozu_bericht([gute_nachricht, schlechte_nachricht]))
@@ -438,5 +504,7 @@ if __name__ == "__main__":
         }
     }
     
-    print(yaml.dump(wozu_config, allow_unicode=True, sort_keys=False))
+    # libyaml-Emitter, falls PyYAML mit C-Bindings installiert ist
+    dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+    print(yaml.dump(wozu_config, Dumper=dumper, allow_unicode=True, sort_keys=False))
     print("\nQ! = Qawana! + DWEKUT!")
@@ -2,9 +2,18 @@
 # -*- coding: utf-8 -*-
 """
 WWAQ Parser REST API
+
+Produktivbetrieb (aus dem Verzeichnis parser/):
+    gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:5785 api:app
+
+Jeder Worker importiert das Modul selbst und erhält so einen eigenen
+Parser; der Parser hält keine offenen Dateien oder Locks und ist damit
+fork-sicher (auch mit --preload). Die Statistik gilt pro Worker.
 """
 
-from flask import Flask, request, jsonify
+import json
+import orjson
+from flask import Flask, Response, request
 from flask_cors import CORS
 from datetime import datetime
 from wwaq_parser import WWAQGlossarParser
@@ -13,10 +22,21 @@ app = Flask(__name__)
 CORS(app)
 parser = WWAQGlossarParser()
 
+def json_antwort(daten) -> Response:
+    """JSON-Antwort via orjson (UTF-8-Bytes direkt, ohne Flask-Encoder)"""
+    try:
+        body = orjson.dumps(daten)
+    except orjson.JSONEncodeError:
+        # Einzelne Surrogate (aus JSON-Escapes wie "\ud800") und Ganzzahlen über
+        # 64 Bit kann orjson nicht kodieren; die Standardbibliothek escapet sie
+        # wie jsonify nach ASCII
+        body = json.dumps(daten)
+    return Response(body, mimetype='application/json')
+
 @app.route('/')
 def index():
     """API Info"""
-    return jsonify({
+    return json_antwort({
         'name': 'WWAQ-Glossar-Parser API',
         'version': '5785.1.1',
         'endpoints': {
@@ -34,7 +54,7 @@ def transform():
     
     transformiert, änderungen = parser.transformiere(text)
     
-    return jsonify({
+    return json_antwort({
         'original': text,
         'transformiert': transformiert,
         'änderungen': änderungen,
@@ -50,13 +70,14 @@ def validate():
     
     validierung = parser.validiere_begriff(begriff)
     
-    return jsonify(validierung)
+    return json_antwort(validierung)
 
 @app.route('/stats', methods=['GET'])
 def stats():
     """Zeigt Statistik"""
-    return jsonify(parser.zeige_statistik())
+    return json_antwort(parser.zeige_statistik())
 
 if __name__ == '__main__':
+    # Nur Entwicklungsserver - für Last siehe gunicorn-Aufruf oben
     print("WWAQ Parser API startet auf Port 5785...")
-    app.run(host='0.0.0.0', port=5785, debug=True)
+    app.run(host='0.0.0.0', port=5785)
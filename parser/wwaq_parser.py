@@ -12,32 +12,51 @@ import yaml
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional
+
+
+# Bereits gefundene Glossar-Dateien; ein Fehlen wird nicht gemerkt,
+# damit eine später angelegte Datei noch erkannt wird
+_vorhandene_glossare: Set[Path] = set()
+
+
+def _glossar_vorhanden(pfad: Path) -> bool:
+    """Prüft die Glossar-Datei einmal pro Prozess (nur positive Ergebnisse)"""
+    if pfad not in _vorhandene_glossare and pfad.exists():
+        _vorhandene_glossare.add(pfad)
+    return pfad in _vorhandene_glossare
+
 
 class WWAQGlossarParser:
     """
     Hauptparser für WWAQ-Transformationen
     """
     
+    # Alle Prüfungen von validiere_begriff in einem Scan; der Lookahead
+    # lässt überlappende Treffer zu (z.B. "zerKabbala")
+    _VALIDIERUNG_RE = re.compile(
+        r'(?=(?P<kab>Kabbala)|(?P<qab>Qabbala)|(?P<kaw>Kawana)|(?P<qaw>Qawana)'
+        r'|(?P<zer>(?i:\bzer[a-zäöü]+)))'
+    )
+    
     def __init__(self):
         self.base_path = Path(__file__).parent.parent
         self.glossar_path = self.base_path / "glossar"
         self.glossar = self._lade_glossar()
         self.transformationen = self._initialisiere_transformationen()
+        self._muster, self._ersetzungen = self._kompiliere_transformationen()
         self.statistik = {'transformationen': 0, 'begriffe': 0}
+        self._json_export_schluessel = None
         
     def _lade_glossar(self) -> Dict:
         """Lädt Glossar aus Markdown-Datei"""
         glossar = {}
-        glossar_file = self.glossar_path / "wwaq-tikun-glossar.md"
         
-        if glossar_file.exists():
-            with open(glossar_file, 'r', encoding='utf-8') as f:
-                inhalt = f.read()
-                # Hier würde normalerweise das Glossar geparst werden
-                # Für jetzt nur Basis-Struktur
-                glossar['geladen'] = True
-                glossar['zeitstempel'] = datetime.now().isoformat()
+        if _glossar_vorhanden(self.glossar_path / "wwaq-tikun-glossar.md"):
+            # Hier würde normalerweise das Glossar geparst werden
+            # Für jetzt nur Basis-Struktur
+            glossar['geladen'] = True
+            glossar['zeitstempel'] = datetime.now().isoformat()
         
         return glossar
     
@@ -106,6 +125,18 @@ class WWAQGlossarParser:
             }
         }
     
+    def _kompiliere_transformationen(self) -> Tuple[re.Pattern, List[Tuple[str, str]]]:
+        """Fasst alle Regeln zu einem einzigen Muster mit benannten Gruppen zusammen"""
+        alternativen = []
+        ersetzungen = []
+        
+        for kategorie, regeln in self.transformationen.items():
+            for muster, ersatz in regeln.items():
+                alternativen.append(f"(?P<g{len(ersetzungen)}>{muster})")
+                ersetzungen.append((ersatz, kategorie))
+        
+        return re.compile("|".join(alternativen)), ersetzungen
+    
     def transformiere(self, text: str) -> Tuple[str, List[Dict]]:
         """
         Haupttransformationsfunktion
@@ -118,30 +149,26 @@ class WWAQGlossarParser:
         """
         if not text:
             return "", []
-            
-        transformiert = text
+        
+        # Ein Zeitstempel pro Aufruf statt pro Treffer
+        zeitstempel = datetime.now().isoformat()
+        
         änderungen = []
         
-        # Durchlaufe alle Transformationskategorien
-        for kategorie, regeln in self.transformationen.items():
-            for muster, ersatz in regeln.items():
-                # Finde alle Vorkommen
-                matches = list(re.finditer(muster, transformiert))
-                
-                if matches:
-                    # Ersetze
-                    transformiert = re.sub(muster, ersatz, transformiert)
-                    
-                    # Dokumentiere Änderungen
-                    for match in matches:
-                        änderungen.append({
-                            'kategorie': kategorie,
-                            'original': match.group(),
-                            'ersatz': ersatz,
-                            'position': match.start(),
-                            'kontext': transformiert[max(0, match.start()-20):match.end()+20],
-                            'zeitstempel': datetime.now().isoformat()
-                        })
+        # Ein sub-Durchlauf über alle Kategorien, der Callback dokumentiert die Änderungen
+        def ersetze(match):
+            ersatz, kategorie = self._ersetzungen[int(match.lastgroup[1:])]
+            änderungen.append({
+                'kategorie': kategorie,
+                'original': match.group(),
+                'ersatz': ersatz,
+                'position': match.start(),
+                'kontext': text[max(0, match.start()-20):match.end()+20],
+                'zeitstempel': zeitstempel
+            })
+            return ersatz
+        
+        transformiert = self._muster.sub(ersetze, text)
         
         # Aktualisiere Statistik
         self.statistik['transformationen'] += 1
@@ -158,17 +185,19 @@ class WWAQGlossarParser:
             'zeitstempel': datetime.now().isoformat()
         }
         
+        gefunden = {match.lastgroup for match in self._VALIDIERUNG_RE.finditer(begriff)}
+        
         # Prüfe auf nicht-konforme Schreibweisen
-        if 'Kabbala' in begriff and 'Qabbala' not in begriff:
+        if 'kab' in gefunden and 'qab' not in gefunden:
             validierung['gültig'] = False
             validierung['hinweise'].append('Kabbala sollte als Qabbala geschrieben werden')
             
-        if 'Kawana' in begriff and 'Qawana' not in begriff:
+        if 'kaw' in gefunden and 'qaw' not in gefunden:
             validierung['gültig'] = False
             validierung['hinweise'].append('Kawana sollte als Qawana geschrieben werden')
             
         # Prüfe auf zer-Präfixe
-        if re.search(r'\bzer[a-zäöü]+', begriff, re.IGNORECASE):
+        if 'zer' in gefunden:
             validierung['gültig'] = False
             validierung['hinweise'].append('Destruktive zer-Präfixierung gefunden')
             
@@ -178,6 +207,11 @@ class WWAQGlossarParser:
         """Exportiert Glossar als JSON"""
         json_path = self.glossar_path / "wwaq-tikun-glossar.json"
         
+        # Regeln sind fest, nur die Statistik ändert sich - sonst nicht neu schreiben
+        schluessel = tuple(self.statistik.values())
+        if schluessel == self._json_export_schluessel and json_path.exists():
+            return json_path
+        
         export_data = {
             'version': '5785.1.1',
             'stand': datetime.now().isoformat(),
@@ -187,7 +221,8 @@ class WWAQGlossarParser:
         
         with open(json_path, 'w', encoding='utf-8') as f:
             json.dump(export_data, f, ensure_ascii=False, indent=2)
-            
+        
+        self._json_export_schluessel = schluessel
         return json_path
     
     def zeige_statistik(self) -> Dict:
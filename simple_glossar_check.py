@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 """Einfache WWAQ-Prüfung"""
 
+import mmap
 import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 transformations = {
@@ -13,25 +17,36 @@ transformations = {
     'WWAK': 'WWAQ'
 }
 
+# Ein Muster für alle Begriffe, direkt auf den UTF-8-Bytes der Datei
+pattern = re.compile(b"|".join(re.escape(old.encode('utf-8')) for old in transformations))
+
 def check_file(filepath):
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            counts = Counter(m.group() for m in pattern.finditer(mm))
+
     violations = []
     for old, new in transformations.items():
-        if old in content:
-            count = content.count(old)
+        count = counts[old.encode('utf-8')]
+        if count:
             violations.append(f"{old} ({count}x) → {new}")
-    
+
     return violations
 
-# Prüfe alle Python-Dateien
-base_path = Path.home() / "ez-chajim-wwaq"
-for py_file in base_path.rglob("*.py"):
-    violations = check_file(py_file)
-    if violations:
-        print(f"\n📄 {py_file.name}:")
-        for v in violations:
-            print(f"   ⚠️  {v}")
+def main():
+    # Prüfe alle Python-Dateien, parallel über alle Kerne
+    base_path = Path.home() / "ez-chajim-wwaq"
+    files = list(base_path.rglob("*.py"))
+    with ProcessPoolExecutor() as executor:
+        for py_file, violations in zip(files, executor.map(check_file, files, chunksize=16)):
+            if violations:
+                print(f"\n📄 {py_file.name}:")
+                for v in violations:
+                    print(f"   ⚠️  {v}")
+
+    print("\nQ!")
 
-print("\nQ!")
+if __name__ == "__main__":
+    main()
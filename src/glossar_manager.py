@@ -1,15 +1,76 @@
 """WWAQ Glossar Manager"""
+import re
+from functools import lru_cache
+
 import yaml
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# libyaml-Loader, falls PyYAML mit C-Bindings installiert ist
+_SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@lru_cache(maxsize=1)
+def _lade_regeln():
+    """Lädt das Glossar einmal pro Prozess; alle Regeln längste Schlüssel zuerst"""
+    with open('docs/glossar/wwaq-glossar.yaml', 'r') as f:
+        glossar = yaml.load(f, Loader=_SafeLoader)
+    transformationen = glossar['transformationen']
+    return tuple(sorted((*transformationen['K_zu_Q'].items(),
+                         *transformationen['Zer_Elimination'].items()),
+                        key=lambda regel: -len(regel[0])))
+
+
+@lru_cache(maxsize=1)
+def _baue_automat():
+    """Baut einen Aho-Corasick-Automaten über alle Schlüssel (None ohne pyahocorasick oder Regeln)"""
+    regeln = _lade_regeln()
+    # make_automaton() ohne Wörter liefert keinen durchsuchbaren Automaten
+    if ahocorasick is None or not regeln:
+        return None
+    automat = ahocorasick.Automaton()
+    for old, new in regeln:
+        automat.add_word(old, (len(old), new))
+    automat.make_automaton()
+    return automat
+
+
+@lru_cache(maxsize=1)
+def _baue_muster():
+    """Eine Alternation über alle Schlüssel, längste zuerst (Fallback ohne Automat)"""
+    regeln = _lade_regeln()
+    return re.compile("|".join(re.escape(old) for old, _ in regeln)), dict(regeln)
+
+
 class GlossarManager:
     def __init__(self):
-        with open('docs/glossar/wwaq-glossar.yaml', 'r') as f:
-            self.glossar = yaml.safe_load(f)
-    
+        self._automat = _baue_automat()
+
     def transform(self, text):
         """Wendet WWAQ-Transformationen an"""
-        for old, new in self.glossar['transformationen']['K_zu_Q'].items():
-            text = text.replace(old, new)
-        for old, new in self.glossar['transformationen']['Zer_Elimination'].items():
-            text = text.replace(old, new)
-        return text
+        # Ohne Regeln wäre die Alternation leer und träfe jede Position
+        if not _lade_regeln():
+            return text
+        
+        if self._automat is None:
+            muster, ersatz = _baue_muster()
+            return muster.sub(lambda match: ersatz[match.group()], text)
+
+        # Ein Durchlauf; bei Überlappung gewinnt der früheste, dann längste Treffer.
+        # Nicht iter_long: das verwirft Treffer ganz ("Kabbala" in "zerKabbala"
+        # neben dem Schlüssel "zerKabbalah")
+        treffer = sorted((end - länge + 1, -länge, new)
+                         for end, (länge, new) in self._automat.iter(text))
+        teile = []
+        pos = 0
+        for start, minus_länge, new in treffer:
+            if start < pos:
+                continue
+            teile.append(text[pos:start])
+            teile.append(new)
+            pos = start - minus_länge
+        teile.append(text[pos:])
+        return ''.join(teile)
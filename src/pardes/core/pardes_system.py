@@ -14,10 +14,16 @@ Stand: 5. Tammus 5785
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Tuple
+from typing import ClassVar, Dict, Iterable, Iterator, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+import hashlib
+import pickle
 import re
+import shelve
+import unicodedata
 from datetime import datetime
 
 # WWAQ-Konforme Imports (aus lib/)
@@ -28,9 +34,96 @@ except ImportError:
     # Fallback für Modul-Tests
     def gematria_value(text: str) -> int:
         """Fallback Gematria-Berechnung"""
-        return sum(ord(c) for c in text if c.isalpha())
+        # map/filter iterieren in C, ohne Generator-Frame pro Zeichen
+        return sum(map(ord, filter(str.isalpha, text)))
     HNS10SpiralCalculator = None
 
+# Teil des Festplatten-Cache-Schlüssels: erhöhen, sobald sich die Logik eines
+# Prozessors ändert; die Herkunft von gematria_value (lib oder Fallback) zählt mit
+_CACHE_VERSION = 1
+_GEMATRIA_QUELLE = gematria_value.__module__
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+@lru_cache(maxsize=65536)
+def _cached_gematria(text: str) -> int:
+    """Gematria mit Memoisierung - nur für Wörter; ganze Texte nicht (hielten sie am Leben)"""
+    return gematria_value(text)
+
+# Vorkompilierte Muster der Prozessoren
+# Niqqud bewusst per Regex statt str.translate: bei hebräischem Text (nicht-ASCII)
+# ist translate mit Lösch-Tabelle 1,3-14x langsamer als die Zeichenklasse
+_NIQQUD_RE = re.compile(r'[\u0591-\u05C7]')
+_HEBREW_LETTERS_RE = re.compile(r'[אבגדהוזחטיכלמנסעפצקרשת]+')
+_HEBREW_BLOCK_RE = re.compile(r'[\u0590-\u05FF]+')
+
+# Bedeutsame Zahlen für die Remez-Ebene
+_SIGNIFICANT_GEMATRIA = frozenset((26, 72, 216, 358))  # JHWH, Chesed, Gvurah, Maschiach
+_ROUND_NUMS = frozenset((7, 12, 40, 50))
+
+# Gemeinsame Schlüsselwort-Tabellen
+_SEFIROT = ('כתר', 'חכמה', 'בינה', 'חסד', 'גבורה', 'תפארת', 'נצח', 'הוד', 'יסוד', 'מלכות')
+_WELTEN = ('אצילות', 'בריאה', 'יצירה', 'עשייה')
+
+# Tetragrammaton-Permutationen; der Lookahead findet auch überlappende Vorkommen
+_TETRA_PERMS = ('יהוה', 'יההו', 'יוהה', 'הויה', 'היהו', 'ההיו')
+_TETRA_RE = re.compile('(?=(' + '|'.join(_TETRA_PERMS) + '))')
+
+
+def _nfc(text: str) -> str:
+    """Einheitliche Kodierung für alle Vergleiche; der Quick-Check überspringt NFC-Text"""
+    if unicodedata.is_normalized('NFC', text):
+        return text
+    return unicodedata.normalize('NFC', text)
+
+
+def _prepare_context(text: str, context: Optional[Dict] = None) -> Dict:
+    """Gemeinsame Vorarbeit aller Ebenen (NFC, Niqqud, Tokens, Gematria) einmal pro Text"""
+    if context is not None and context.get('_input') is text:
+        return context
+    
+    normalized = _nfc(text)
+    prepared = dict(context) if context else {}
+    prepared.update({
+        '_input': text,
+        '_text': normalized,
+        '_clean_text': _NIQQUD_RE.sub('', normalized),
+        '_tokens': normalized.split(),
+        '_gematria': gematria_value(normalized)
+    })
+    return prepared
+
+
+class _KeywordMatcher:
+    """Sucht alle Schlüsselwörter mehrerer Kategorien in einem Durchlauf"""
+    
+    def __init__(self, patterns: Dict[str, Tuple[str, ...]]):
+        self.patterns = patterns
+        self._automaton = None
+        if ahocorasick:
+            self._automaton = ahocorasick.Automaton()
+            for keywords in patterns.values():
+                for keyword in keywords:
+                    self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+    
+    def find(self, text: str) -> List[Tuple[str, str]]:
+        """Gefundene (Kategorie, Schlüsselwort)-Paare in Musterreihenfolge"""
+        if self._automaton is None:
+            found = {keyword for keywords in self.patterns.values()
+                     for keyword in keywords if keyword in text}
+        else:
+            found = {keyword for _, keyword in self._automaton.iter(text)}
+        
+        return [(category, keyword)
+                for category, keywords in self.patterns.items()
+                for keyword in keywords
+                if keyword in found]
+
 
 class PardesLevel(Enum):
     """Die vier Ebenen des PaRDeS-Systems"""
@@ -40,7 +133,7 @@ class PardesLevel(Enum):
     SOD = "סוד"        # Geheimnis
 
 
-@dataclass
+@dataclass(slots=True)
 class PardesInterpretation:
     """Container für eine PaRDeS-Interpretation"""
     level: PardesLevel
@@ -65,12 +158,13 @@ class PardesProcessor(ABC):
         """Verarbeite Text auf dieser PaRDeS-Ebene"""
         pass
     
-    def calculate_spiral_grade(self, text: str) -> Optional[int]:
-        """Berechne HNS10-Spiralgrad für Text"""
+    def calculate_spiral_grade(self, text: str, gematria: Optional[int] = None) -> Optional[int]:
+        """Berechne HNS10-Spiralgrad für Text (bereits bekannte Gematria wird übernommen)"""
         if not self.spiral_calc:
             return None
         
-        gematria = gematria_value(text)
+        if gematria is None:
+            gematria = gematria_value(text)
         # Null-Linien-Tabu beachten!
         grade = gematria % 360
         return grade if grade != 0 else 360
@@ -85,31 +179,28 @@ class PschatProcessor(PardesProcessor):
     
     def process(self, text: str, context: Optional[Dict] = None) -> PardesInterpretation:
         """Extrahiere wörtliche Bedeutung"""
-        # Entferne Niqqud und normalisiere
-        clean_text = self._normalize_hebrew(text)
+        context = _prepare_context(text, context)
+        
+        # Niqqud-freier Text (bereits in der Vorarbeit normalisiert)
+        clean_text = context['_clean_text']
         
         # Extrahiere Schlüsselwörter
         keywords = self._extract_keywords(clean_text)
         
         # Basale Interpretation
         interpretation = f"Wörtlicher Text: {clean_text}"
+        gematria = gematria_value(clean_text)
         
         return PardesInterpretation(
             level=self.level,
             text=text,
             interpretation=interpretation,
-            gematria=gematria_value(clean_text),
-            spiral_grade=self.calculate_spiral_grade(clean_text),
+            gematria=gematria,
+            spiral_grade=self.calculate_spiral_grade(clean_text, gematria),
             keywords=keywords,
             metadata={'normalized': clean_text}
         )
     
-    def _normalize_hebrew(self, text: str) -> str:
-        """Normalisiere hebräischen Text"""
-        # Entferne Niqqud (Vokalisierung)
-        niqqud_pattern = r'[\u0591-\u05C7]'
-        return re.sub(niqqud_pattern, '', text)
-    
     def _extract_keywords(self, text: str) -> List[str]:
         """Extrahiere Schlüsselwörter"""
         # Einfache Wort-Tokenisierung
@@ -121,25 +212,33 @@ class PschatProcessor(PardesProcessor):
 class RemezProcessor(PardesProcessor):
     """Prozessor für Remez (Andeutung) Ebene"""
     
+    # Bekannte Andeutungsmuster
+    HINT_PATTERNS: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        'sefirot': _SEFIROT,
+        'welten': _WELTEN,
+        'namen': ('אהיה', 'יהוה', 'אלהים', 'אדני')
+    }
+    
     def __init__(self):
         super().__init__()
         self.level = PardesLevel.REMEZ
-        self.hint_patterns = self._load_hint_patterns()
     
     def process(self, text: str, context: Optional[Dict] = None) -> PardesInterpretation:
         """Finde Andeutungen und versteckte Hinweise"""
+        context = _prepare_context(text, context)
+        normalized = context['_text']
         hints = []
         
         # Suche nach Gematria-Verbindungen
-        gematria_hints = self._find_gematria_hints(text)
+        gematria_hints = self._find_gematria_hints(context['_tokens'])
         hints.extend(gematria_hints)
         
         # Suche nach Akronymen
-        acronym_hints = self._find_acronyms(text)
+        acronym_hints = self._find_acronyms(normalized)
         hints.extend(acronym_hints)
         
         # Suche nach Zahlenmustern
-        number_hints = self._find_number_patterns(text)
+        number_hints = self._find_number_patterns(normalized)
         hints.extend(number_hints)
         
         interpretation = "Gefundene Andeutungen: " + "; ".join(hints) if hints else "Keine direkten Andeutungen gefunden"
@@ -148,29 +247,20 @@ class RemezProcessor(PardesProcessor):
             level=self.level,
             text=text,
             interpretation=interpretation,
-            gematria=gematria_value(text),
-            spiral_grade=self.calculate_spiral_grade(text),
+            gematria=context['_gematria'],
+            spiral_grade=self.calculate_spiral_grade(text, context['_gematria']),
             keywords=self._extract_hint_keywords(hints),
             metadata={'hints': hints}
         )
     
-    def _load_hint_patterns(self) -> Dict[str, List[str]]:
-        """Lade bekannte Andeutungsmuster"""
-        return {
-            'sefirot': ['כתר', 'חכמה', 'בינה', 'חסד', 'גבורה', 'תפארת', 'נצח', 'הוד', 'יסוד', 'מלכות'],
-            'welten': ['אצילות', 'בריאה', 'יצירה', 'עשייה'],
-            'namen': ['אהיה', 'יהוה', 'אלהים', 'אדני']
-        }
-    
-    def _find_gematria_hints(self, text: str) -> List[str]:
+    def _find_gematria_hints(self, words: List[str]) -> List[str]:
         """Finde Wörter mit bedeutsamer Gematria"""
         hints = []
-        words = text.split()
         
-        for word in words:
-            value = gematria_value(word)
+        # Werte aller Tokens in einem map-Durchlauf (memoisiert, wiederholte Wörter sind O(1))
+        for word, value in zip(words, map(_cached_gematria, words)):
             # Prüfe auf bedeutsame Zahlen
-            if value in [26, 72, 216, 358]:  # JHWH, Chesed, Gvurah, Maschiach
+            if value in _SIGNIFICANT_GEMATRIA:
                 hints.append(f"{word} (Gematria: {value})")
         
         return hints
@@ -184,10 +274,10 @@ class RemezProcessor(PardesProcessor):
         """Finde Zahlenmuster im Text"""
         patterns = []
         # Suche nach hebräischen Zahlen
-        hebrew_numbers = re.findall(r'[אבגדהוזחטיכלמנסעפצקרשת]+', text)
+        hebrew_numbers = _HEBREW_LETTERS_RE.findall(text)
         for num in hebrew_numbers:
-            value = gematria_value(num)
-            if value % 10 == 0 or value in [7, 12, 40, 50]:
+            value = _cached_gematria(num)
+            if value % 10 == 0 or value in _ROUND_NUMS:
                 patterns.append(f"Zahlenmuster: {num} = {value}")
         return patterns
     
@@ -196,35 +286,47 @@ class RemezProcessor(PardesProcessor):
         keywords = []
         for hint in hints:
             # Extrahiere hebräische Wörter
-            hebrew_words = re.findall(r'[\u0590-\u05FF]+', hint)
+            hebrew_words = _HEBREW_BLOCK_RE.findall(hint)
             keywords.extend(hebrew_words)
-        return list(set(keywords))
+        return list(dict.fromkeys(keywords))
 
 
 class DraschProcessor(PardesProcessor):
     """Prozessor für Drasch (Auslegung) Ebene"""
     
+    # Midrasch-Muster
+    MIDRASH_PATTERNS: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        'schöpfung': ('בראשית', 'אור', 'חשך', 'מים'),
+        'erlösung': ('גאולה', 'משיח', 'תיקון'),
+        'tora': ('תורה', 'מצוה', 'הלכה')
+    }
+    
+    # Automaten einmal pro Klasse, von allen Instanzen geteilt
+    _midrash_matcher: ClassVar[_KeywordMatcher] = _KeywordMatcher(MIDRASH_PATTERNS)
+    _theme_matcher: ClassVar[_KeywordMatcher] = _KeywordMatcher({'Sefira': _SEFIROT, 'Welt': _WELTEN})
+    
     def __init__(self):
         super().__init__()
         self.level = PardesLevel.DRASCH
-        self.midrash_patterns = self._load_midrash_patterns()
     
     def process(self, text: str, context: Optional[Dict] = None) -> PardesInterpretation:
         """Erstelle tiefere Auslegungen"""
+        context = _prepare_context(text, context)
+        normalized = context['_text']
         interpretations = []
         
         # Suche nach Midrasch-Mustern
-        midrash_refs = self._find_midrash_connections(text)
+        midrash_refs = self._find_midrash_connections(normalized)
         if midrash_refs:
             interpretations.append(f"Midrasch-Verbindungen: {', '.join(midrash_refs)}")
         
         # Analysiere Struktur
-        structural_analysis = self._analyze_structure(text)
+        structural_analysis = self._analyze_structure(normalized, context['_tokens'])
         if structural_analysis:
             interpretations.append(f"Strukturanalyse: {structural_analysis}")
         
         # Finde thematische Verbindungen
-        themes = self._extract_themes(text, context)
+        themes = self._extract_themes(normalized, context)
         if themes:
             interpretations.append(f"Themen: {', '.join(themes)}")
         
@@ -234,54 +336,27 @@ class DraschProcessor(PardesProcessor):
             level=self.level,
             text=text,
             interpretation=interpretation,
-            gematria=gematria_value(text),
-            spiral_grade=self.calculate_spiral_grade(text),
+            gematria=context['_gematria'],
+            spiral_grade=self.calculate_spiral_grade(text, context['_gematria']),
             keywords=themes,
             cross_references=midrash_refs,
             metadata={'structure': structural_analysis}
         )
     
-    def _load_midrash_patterns(self) -> Dict[str, List[str]]:
-        """Lade Midrasch-Muster"""
-        return {
-            'schöpfung': ['בראשית', 'אור', 'חשך', 'מים'],
-            'erlösung': ['גאולה', 'משיח', 'תיקון'],
-            'tora': ['תורה', 'מצוה', 'הלכה']
-        }
-    
     def _find_midrash_connections(self, text: str) -> List[str]:
         """Finde Verbindungen zu klassischen Midraschim"""
-        connections = []
-        
-        for theme, keywords in self.midrash_patterns.items():
-            for keyword in keywords:
-                if keyword in text:
-                    connections.append(f"{theme} ({keyword})")
-        
-        return connections
+        return [f"{theme} ({keyword})" for theme, keyword in self._midrash_matcher.find(text)]
     
-    def _analyze_structure(self, text: str) -> str:
+    def _analyze_structure(self, text: str, words: List[str]) -> str:
         """Analysiere Textstruktur"""
         sentences = text.split('.')
-        words = text.split()
         
         return f"{len(sentences)} Sätze, {len(words)} Wörter"
     
     def _extract_themes(self, text: str, context: Optional[Dict] = None) -> List[str]:
         """Extrahiere thematische Elemente"""
-        themes = []
-        
-        # Prüfe auf Sefirot-Erwähnungen
-        sefirot = ['כתר', 'חכמה', 'בינה', 'חסד', 'גבורה', 'תפארת', 'נצח', 'הוד', 'יסוד', 'מלכות']
-        for sefira in sefirot:
-            if sefira in text:
-                themes.append(f"Sefira: {sefira}")
-        
-        # Prüfe auf Welten
-        welten = ['אצילות', 'בריאה', 'יצירה', 'עשייה']
-        for welt in welten:
-            if welt in text:
-                themes.append(f"Welt: {welt}")
+        # Sefirot- und Welten-Erwähnungen
+        themes = [f"{category}: {keyword}" for category, keyword in self._theme_matcher.find(text)]
         
         return themes
 
@@ -295,26 +370,29 @@ class SodProcessor(PardesProcessor):
     
     def process(self, text: str, context: Optional[Dict] = None) -> PardesInterpretation:
         """Enthülle mystische/geheime Bedeutungen"""
+        context = _prepare_context(text, context)
+        normalized = context['_text']
+        standard = context['_gematria']
         secrets = []
         
         # Tiefe Gematria-Analyse
-        deep_gematria = self._deep_gematria_analysis(text)
+        deep_gematria = self._deep_gematria_analysis(normalized, standard)
         if deep_gematria:
             secrets.append(f"Tiefe Gematria: {deep_gematria}")
         
         # Spiralzeit-Integration
         if self.spiral_calc:
-            spiral_secrets = self._spiral_time_analysis(text)
+            spiral_secrets = self._spiral_time_analysis(normalized, standard)
             if spiral_secrets:
                 secrets.append(f"Spiralzeit: {spiral_secrets}")
         
         # Buchstaben-Permutationen
-        permutations = self._letter_permutations(text)
+        permutations = self._letter_permutations(context['_tokens'])
         if permutations:
             secrets.append(f"Permutationen: {', '.join(permutations[:3])}")
         
         # Versteckte Namen
-        hidden_names = self._find_hidden_names(text)
+        hidden_names = self._find_hidden_names(normalized)
         if hidden_names:
             secrets.append(f"Versteckte Namen: {', '.join(hidden_names)}")
         
@@ -324,15 +402,16 @@ class SodProcessor(PardesProcessor):
             level=self.level,
             text=text,
             interpretation=interpretation,
-            gematria=gematria_value(text),
-            spiral_grade=self.calculate_spiral_grade(text),
+            gematria=context['_gematria'],
+            spiral_grade=self.calculate_spiral_grade(text, context['_gematria']),
             keywords=hidden_names,
             metadata={'secrets': secrets}
         )
     
-    def _deep_gematria_analysis(self, text: str) -> str:
+    def _deep_gematria_analysis(self, text: str, standard: Optional[int] = None) -> str:
         """Tiefe Gematria-Analyse mit mehreren Methoden"""
-        standard = gematria_value(text)
+        if standard is None:
+            standard = gematria_value(text)
         
         # Kleine Gematria (Mispar Katan)
         small = standard % 9 or 9
@@ -342,12 +421,12 @@ class SodProcessor(PardesProcessor):
         
         return f"Standard: {standard}, Klein: {small}, Quadrat: {square}"
     
-    def _spiral_time_analysis(self, text: str) -> str:
+    def _spiral_time_analysis(self, text: str, standard: Optional[int] = None) -> str:
         """Analyse im Kontext der Spiralzeit"""
         if not self.spiral_calc:
             return ""
         
-        grade = self.calculate_spiral_grade(text)
+        grade = self.calculate_spiral_grade(text, standard)
         if grade:
             # Berechne Position auf der Spirale
             winding = grade // 360 + 1
@@ -356,10 +435,9 @@ class SodProcessor(PardesProcessor):
             return f"Windung {winding}, Position {position}°"
         return ""
     
-    def _letter_permutations(self, text: str) -> List[str]:
+    def _letter_permutations(self, words: List[str]) -> List[str]:
         """Finde bedeutsame Buchstaben-Permutationen"""
         # Vereinfachte Implementierung - nur erste 3 Buchstaben
-        words = text.split()
         permutations = []
         
         for word in words[:2]:  # Begrenzen für Performance
@@ -379,9 +457,9 @@ class SodProcessor(PardesProcessor):
             hidden.append("72-Namen-Fragment")
         
         # Prüfe auf Tetragrammaton-Permutationen
-        tetra_perms = ['יהוה', 'יההו', 'יוהה', 'הויה', 'היהו', 'ההיו']
-        for perm in tetra_perms:
-            if perm in text:
+        found = set(_TETRA_RE.findall(text))
+        for perm in _TETRA_PERMS:
+            if perm in found:
                 hidden.append(f"JHWH-Permutation: {perm}")
         
         return hidden
@@ -390,33 +468,80 @@ class SodProcessor(PardesProcessor):
 class PardesAnalyzer:
     """Haupt-Analysator für alle PaRDeS-Ebenen"""
     
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None):
         self.processors = {
             PardesLevel.PSCHAT: PschatProcessor(),
             PardesLevel.REMEZ: RemezProcessor(),
             PardesLevel.DRASCH: DraschProcessor(),
             PardesLevel.SOD: SodProcessor()
         }
-    
-    def analyze_text(self, text: str, context: Optional[Dict] = None) -> Dict[PardesLevel, PardesInterpretation]:
-        """Analysiere Text auf allen vier Ebenen"""
-        results = {}
-        
-        for level, processor in self.processors.items():
-            try:
-                interpretation = processor.process(text, context)
-                results[level] = interpretation
-            except Exception as e:
-                # Fehlerbehandlung
-                results[level] = PardesInterpretation(
-                    level=level,
-                    text=text,
-                    interpretation=f"Fehler bei Verarbeitung: {str(e)}",
-                    metadata={'error': str(e)}
-                )
+        # Optionaler Festplatten-Cache (z.B. '~/.cache/pardes'); Analysen sind
+        # deterministisch in (text, context). Nicht für parallele Schreiber gedacht.
+        self.cache_path = None
+        if cache_dir:
+            cache_dir = Path(cache_dir).expanduser()
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            self.cache_path = str(cache_dir / 'pardes_analysen')
+    
+    def analyze_text(self, text: str, context: Optional[Dict] = None,
+                     levels: Optional[Iterable[PardesLevel]] = None) -> Dict[PardesLevel, PardesInterpretation]:
+        """Analysiere Text auf allen vier Ebenen (oder nur auf den angegebenen)"""
+        if levels is None:
+            processors = self.processors
+        else:
+            processors = {}
+            for level in levels:
+                if level not in self.processors:
+                    raise ValueError(f"Unbekannte PaRDeS-Ebene: {level}")
+                processors[level] = self.processors[level]
+        
+        if not self.cache_path:
+            return self._analyze_levels(text, context, processors)
+        
+        # Vorarbeit-Schlüssel (_tokens, ...) folgen aus dem Text und zählen nicht mit
+        public_context = {key: value for key, value in (context or {}).items()
+                          if not key.startswith('_')}
+        cache_key = hashlib.blake2b(repr((
+            _CACHE_VERSION, _GEMATRIA_QUELLE, text, public_context,
+            [level.name for level in processors]
+        )).encode('utf-8')).hexdigest()
+        
+        # Ein Öffnen für Nachschlagen und Speichern
+        with shelve.open(self.cache_path, protocol=pickle.HIGHEST_PROTOCOL) as cache:
+            results = cache.get(cache_key)
+            if results is None:
+                results = self._analyze_levels(text, context, processors)
+                # Fehlerergebnisse nicht festschreiben
+                if not any('error' in r.metadata for r in results.values()):
+                    cache[cache_key] = results
         
         return results
     
+    def _analyze_levels(self, text: str, context: Optional[Dict],
+                        processors: Dict[PardesLevel, PardesProcessor]) -> Dict[PardesLevel, PardesInterpretation]:
+        """Führe die gewählten Prozessoren über eine gemeinsame Vorarbeit aus"""
+        # Tokens, Normalisierung und Gematria einmal für alle Prozessoren
+        context = _prepare_context(text, context)
+        
+        return {
+            level: self._run_processor(level, processor, text, context)
+            for level, processor in processors.items()
+        }
+    
+    def _run_processor(self, level: PardesLevel, processor: PardesProcessor,
+                       text: str, context: Dict) -> PardesInterpretation:
+        """Führe einen Prozessor aus; Fehler werden zur Interpretation"""
+        try:
+            return processor.process(text, context)
+        except Exception as e:
+            # Fehlerbehandlung
+            return PardesInterpretation(
+                level=level,
+                text=text,
+                interpretation=f"Fehler bei Verarbeitung: {str(e)}",
+                metadata={'error': str(e)}
+            )
+    
     def analyze_with_focus(self, text: str, focus_level: PardesLevel, context: Optional[Dict] = None) -> PardesInterpretation:
         """Analysiere mit Fokus auf eine spezifische Ebene"""
         if focus_level not in self.processors:
@@ -424,35 +549,42 @@ class PardesAnalyzer:
         
         return self.processors[focus_level].process(text, context)
     
-    def generate_report(self, text: str, context: Optional[Dict] = None) -> str:
-        """Generiere umfassenden PaRDeS-Bericht"""
-        results = self.analyze_text(text, context)
-        
-        report_lines = [
-            "=== PaRDeS-ANALYSE ===",
-            f"Text: {text[:50]}..." if len(text) > 50 else f"Text: {text}",
-            f"Gesamt-Gematria: {gematria_value(text)}",
-            ""
-        ]
+    def generate_report(self, text: str, context: Optional[Dict] = None,
+                        levels: Optional[Iterable[PardesLevel]] = None) -> str:
+        """Generiere PaRDeS-Bericht; mit levels werden nur diese Ebenen analysiert"""
+        # Die Vorarbeit liefert auch die Gesamt-Gematria des Kopfes
+        context = _prepare_context(text, context)
+        results = self.analyze_text(text, context, levels)
+        return "\n".join(self._report_lines(text, context['_gematria'], results))
+    
+    def _report_lines(self, text: str, gematria: int,
+                      results: Dict[PardesLevel, PardesInterpretation]) -> Iterator[str]:
+        """Erzeuge die Berichtszeilen (ohne leere Platzhalterzeilen)"""
+        yield "=== PaRDeS-ANALYSE ==="
+        yield f"Text: {text[:50]}..." if len(text) > 50 else f"Text: {text}"
+        yield f"Gesamt-Gematria: {gematria}"
+        yield ""
         
         for level, interpretation in results.items():
-            report_lines.extend([
-                f"--- {level.name} ({level.value}) ---",
-                f"Interpretation: {interpretation.interpretation}",
-                f"Gematria: {interpretation.gematria}",
-                f"Spiralgrad: {interpretation.spiral_grade}°" if interpretation.spiral_grade else "Spiralgrad: N/A",
-                f"Schlüsselwörter: {', '.join(interpretation.keywords)}" if interpretation.keywords else "",
-                ""
-            ])
-        
-        report_lines.append("Q!")
-        return "\n".join(report_lines)
+            yield f"--- {level.name} ({level.value}) ---"
+            yield f"Interpretation: {interpretation.interpretation}"
+            yield f"Gematria: {interpretation.gematria}"
+            yield f"Spiralgrad: {interpretation.spiral_grade}°" if interpretation.spiral_grade else "Spiralgrad: N/A"
+            if interpretation.keywords:
+                yield f"Schlüsselwörter: {', '.join(interpretation.keywords)}"
+            yield ""
+        
+        yield "Q!"
 
 
 # Hilfsfunktionen für Export
 def export_pardes_to_yaml(interpretations: Dict[PardesLevel, PardesInterpretation]) -> str:
     """Exportiere PaRDeS-Interpretationen als YAML"""
     import yaml
+    try:
+        from yaml import CDumper as Dumper  # libyaml
+    except ImportError:
+        from yaml import Dumper
     
     export_data = {
         'pardes_analysis': {
@@ -471,7 +603,7 @@ def export_pardes_to_yaml(interpretations: Dict[PardesLevel, PardesInterpretatio
         'wwaq_conformity': 'validated'
     }
     
-    return yaml.dump(export_data, allow_unicode=True, sort_keys=False)
+    return yaml.dump(export_data, Dumper=Dumper, allow_unicode=True, sort_keys=False)
 
 
 # Beispiel-Verwendung und Tests
@@ -0,0 +1,29 @@
+"""Gemeinsame Fixtures"""
+import pytest
+import yaml
+
+from src import glossar_manager
+
+
+def _leere_glossar_caches():
+    for funktion in (glossar_manager._lade_regeln, glossar_manager._baue_automat,
+                     glossar_manager._baue_muster):
+        funktion.cache_clear()
+
+
+@pytest.fixture
+def glossar(tmp_path, monkeypatch):
+    """Schreibt ein Test-Glossar nach docs/glossar/ und wechselt dorthin; die Prozess-Caches werden geleert"""
+    def schreibe(k_zu_q, zer_elimination=None):
+        pfad = tmp_path / "docs" / "glossar" / "wwaq-glossar.yaml"
+        pfad.parent.mkdir(parents=True, exist_ok=True)
+        pfad.write_text(yaml.safe_dump({'transformationen': {
+            'K_zu_Q': k_zu_q,
+            'Zer_Elimination': zer_elimination or {},
+        }}, allow_unicode=True), encoding='utf-8')
+        monkeypatch.chdir(tmp_path)
+        _leere_glossar_caches()
+
+    yield schreibe
+
+    _leere_glossar_caches()
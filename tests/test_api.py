@@ -0,0 +1,55 @@
+"""Tests für die REST-API"""
+import importlib
+import json
+from pathlib import Path
+
+import pytest
+
+PARSER_DIR = Path(__file__).parent.parent / "parser"
+
+
+@pytest.fixture
+def api(monkeypatch):
+    # api.py importiert wwaq_parser direkt aus seinem Verzeichnis
+    monkeypatch.syspath_prepend(str(PARSER_DIR))
+    return importlib.import_module("api")
+
+
+@pytest.fixture
+def client(api):
+    return api.app.test_client()
+
+
+def test_transform_mit_einzelnem_surrogat(client):
+    # Gültiges JSON-Escape, das json.loads zu einem einzelnen Surrogat macht
+    antwort = client.post("/transform", data='{"text": "Kabbala \\ud800"}',
+                          content_type="application/json")
+
+    assert antwort.status_code == 200
+    daten = json.loads(antwort.get_data())
+    assert daten['original'] == "Kabbala \ud800"
+    assert daten['transformiert'] == "Qabbala \ud800"
+
+
+def test_validate_mit_einzelnem_surrogat(client):
+    antwort = client.post("/validate", data='{"begriff": "\\ud800"}',
+                          content_type="application/json")
+
+    assert antwort.status_code == 200
+    assert json.loads(antwort.get_data())['begriff'] == "\ud800"
+
+
+def test_transform_antwort_ueber_orjson(client):
+    antwort = client.post("/transform", json={"text": "Die Kabbala"})
+
+    assert antwort.status_code == 200
+    assert antwort.mimetype == "application/json"
+    # orjson schreibt Nicht-ASCII direkt als UTF-8
+    assert "anzahl_änderungen".encode('utf-8') in antwort.get_data()
+    assert json.loads(antwort.get_data())['transformiert'] == "Die Qabbala"
+
+
+def test_ganzzahl_ueber_64_bit(api):
+    antwort = api.json_antwort({'wert': 2 ** 70})
+
+    assert json.loads(antwort.get_data()) == {'wert': 2 ** 70}
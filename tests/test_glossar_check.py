@@ -0,0 +1,21 @@
+"""Tests für die einfache WWAQ-Prüfung"""
+from simple_glossar_check import check_file
+
+
+def test_verstoesse_werden_gezaehlt(tmp_path):
+    datei = tmp_path / "modul.py"
+    datei.write_text("# Kabbala, Kabbala und zerstören\nWWAK = 'zerstören'\n", encoding='utf-8')
+
+    assert check_file(datei) == [
+        "zerstören (2x) → wandeln",
+        "Kabbala (2x) → Qabbala",
+        "WWAK (1x) → WWAQ",
+    ]
+
+
+def test_leere_datei(tmp_path):
+    # mmap kann keine leere Datei abbilden
+    datei = tmp_path / "leer.py"
+    datei.touch()
+
+    assert check_file(datei) == []
@@ -0,0 +1,126 @@
+"""Tests für den PaRDeS-Analysator"""
+import unicodedata
+
+import pytest
+
+from src.pardes.core import pardes_system
+from src.pardes.core.pardes_system import PardesAnalyzer, PardesLevel
+
+TEXT = "בראשית ברא אלהים את השמים ואת הארץ"
+
+
+def test_cache_liefert_gespeicherte_analyse(tmp_path, monkeypatch):
+    analyzer = PardesAnalyzer(cache_dir=tmp_path)
+    erste = analyzer.analyze_text(TEXT)
+
+    # Ein Treffer darf die Prozessoren nicht mehr aufrufen
+    monkeypatch.setattr(analyzer, '_analyze_levels',
+                        lambda *args: pytest.fail("Cache-Treffer erwartet"))
+    zweite = analyzer.analyze_text(TEXT)
+
+    assert zweite.keys() == erste.keys()
+    assert all(zweite[level].interpretation == erste[level].interpretation for level in erste)
+
+
+def test_cache_version_im_schluessel(tmp_path, monkeypatch):
+    PardesAnalyzer(cache_dir=tmp_path).analyze_text(TEXT, levels=[PardesLevel.PSCHAT])
+
+    monkeypatch.setattr(pardes_system, '_CACHE_VERSION', pardes_system._CACHE_VERSION + 1)
+    analyzer = PardesAnalyzer(cache_dir=tmp_path)
+    aufrufe = []
+    original = analyzer._analyze_levels
+    monkeypatch.setattr(analyzer, '_analyze_levels',
+                        lambda *args: aufrufe.append(args) or original(*args))
+    analyzer.analyze_text(TEXT, levels=[PardesLevel.PSCHAT])
+
+    assert len(aufrufe) == 1
+
+
+# Präsentationsform U+FB2A; NFC zerlegt sie in Schin + Schin-Punkt
+ZERLEGBAR = "ברשׁית"
+
+
+def test_nfc_in_allen_einstiegen():
+    analyzer = PardesAnalyzer()
+    erwartet = analyzer.analyze_text(unicodedata.normalize('NFC', ZERLEGBAR))
+    ergebnis = analyzer.analyze_text(ZERLEGBAR)
+
+    for level, processor in analyzer.processors.items():
+        for interpretation in (ergebnis[level],
+                               analyzer.analyze_with_focus(ZERLEGBAR, level),
+                               processor.process(ZERLEGBAR)):
+            assert interpretation.interpretation == erwartet[level].interpretation
+            assert interpretation.gematria == erwartet[level].gematria
+            # Der Text des Aufrufers bleibt unverändert
+            assert interpretation.text == ZERLEGBAR
+
+
+def test_bericht_gematria_aus_nfc_text():
+    bericht = PardesAnalyzer().generate_report(ZERLEGBAR, levels=[PardesLevel.SOD]).splitlines()
+    gesamt = bericht[2].removeprefix("Gesamt-Gematria: ")
+
+    # Sod rechnet mit der Gematria des ganzen Textes
+    assert f"Gematria: {gesamt}" in bericht[4:]
+
+
+def test_keyword_matcher_automat_wie_fallback(monkeypatch):
+    if pardes_system.ahocorasick is None:
+        pytest.skip("pyahocorasick nicht installiert")
+    text = "בראשית ברא אלהים את השמים ואת הארץ ותורה אור במלכות ובריאה"
+    patterns = pardes_system.DraschProcessor.MIDRASH_PATTERNS
+    mit_automat = pardes_system._KeywordMatcher(patterns).find(text)
+
+    monkeypatch.setattr(pardes_system, 'ahocorasick', None)
+    assert pardes_system._KeywordMatcher(patterns).find(text) == mit_automat
+    assert mit_automat
+
+
+def test_bericht_nur_angefragte_ebenen():
+    bericht = PardesAnalyzer().generate_report(TEXT, levels=[PardesLevel.REMEZ, PardesLevel.PSCHAT])
+    ueberschriften = [zeile for zeile in bericht.splitlines() if zeile.startswith("--- ")]
+
+    assert ueberschriften == ["--- REMEZ (רמז) ---", "--- PSCHAT (פשט) ---"]
+    assert bericht.endswith("Q!")
+
+
+def test_bericht_unbekannte_ebene():
+    with pytest.raises(ValueError, match="Unbekannte PaRDeS-Ebene"):
+        PardesAnalyzer().generate_report(TEXT, levels=[PardesLevel.SOD, "SOD"])
+
+
+def test_gematria_cache_nur_fuer_woerter(monkeypatch):
+    abgefragt = []
+    cached = pardes_system._cached_gematria
+    monkeypatch.setattr(pardes_system, '_cached_gematria',
+                        lambda text: abgefragt.append(text) or cached(text))
+
+    PardesAnalyzer().generate_report(TEXT)
+
+    # Ganze Texte blieben sonst für die Prozesslaufzeit im Cache
+    assert abgefragt
+    assert all(' ' not in text for text in abgefragt)
+
+
+def test_ueberlappende_tetragrammaton_permutationen():
+    # "יהוה" und "היהו" teilen sich ein He
+    namen = pardes_system.SodProcessor()._find_hidden_names("יהוהיהו")
+
+    assert namen == ["72-Namen-Fragment", "JHWH-Permutation: יהוה", "JHWH-Permutation: היהו"]
+
+
+def test_yaml_export():
+    import yaml
+
+    ergebnis = PardesAnalyzer().analyze_text(TEXT, levels=[PardesLevel.PSCHAT, PardesLevel.SOD])
+    daten = yaml.safe_load(pardes_system.export_pardes_to_yaml(ergebnis))
+
+    assert list(daten['pardes_analysis']) == ['pschat', 'sod']
+    assert daten['pardes_analysis']['pschat']['hebrew_name'] == "פשט"
+    assert daten['pardes_analysis']['pschat']['keywords'] == ergebnis[PardesLevel.PSCHAT].keywords
+    assert daten['wwaq_conformity'] == 'validated'
+
+
+def test_hinweis_schluesselwoerter_ohne_duplikate():
+    hinweise = ["יהוה (Gematria: 26)", "Zahlenmuster: חסד = 72", "יהוה (Gematria: 26)"]
+
+    assert pardes_system.RemezProcessor()._extract_hint_keywords(hinweise) == ["יהוה", "חסד"]
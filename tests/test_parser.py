@@ -0,0 +1,97 @@
+"""Tests für den WWAQGlossarParser"""
+import json
+
+import pytest
+
+from parser import wwaq_parser
+
+TEXT = "Die Kabbalah lehrt: Tikkun statt zerbrechen, Kabbala und Atzilut."
+
+
+@pytest.fixture
+def parser():
+    return wwaq_parser.WWAQGlossarParser()
+
+
+def test_transformiere_mehrere_regeln(parser):
+    transformiert, änderungen = parser.transformiere(TEXT)
+
+    assert transformiert == "Die Qabbala lehrt: Tiqqun statt bersten, Qabbala und Azilut."
+    # Trefferreihenfolge, Kategorie je Regel
+    assert [(ä['original'], ä['ersatz'], ä['kategorie']) for ä in änderungen] == [
+        ('Kabbalah', 'Qabbala', 'k_zu_q'),
+        ('Tikkun', 'Tiqqun', 'din_31636'),
+        ('zerbrechen', 'bersten', 'zer_elimination'),
+        ('Kabbala', 'Qabbala', 'k_zu_q'),
+        ('Atzilut', 'Azilut', 'din_31636'),
+    ]
+    assert len({ä['zeitstempel'] for ä in änderungen}) == 1
+
+
+def test_positionen_beziehen_sich_auf_eingabe(parser):
+    _, änderungen = parser.transformiere(TEXT)
+
+    for änderung in änderungen:
+        start = änderung['position']
+        assert TEXT[start:start + len(änderung['original'])] == änderung['original']
+        assert änderung['kontext'] == TEXT[max(0, start-20):start + len(änderung['original'])+20]
+
+
+def test_keine_ersetzung_innerhalb_von_woertern(parser):
+    transformiert, änderungen = parser.transformiere("ÄKabbala Kabbalaß Zerbrechende")
+
+    assert transformiert == "ÄKabbala Kabbalaß Zerbrechende"
+    assert änderungen == []
+
+
+def test_statistik(parser):
+    parser.transformiere(TEXT)
+    parser.transformiere("")
+
+    assert parser.statistik == {'transformationen': 1, 'begriffe': 5}
+
+
+@pytest.mark.parametrize("begriff, gültig, hinweise", [
+    ("Kabbala", False, ['Kabbala sollte als Qabbala geschrieben werden']),
+    ("Kawana", False, ['Kawana sollte als Qawana geschrieben werden']),
+    ("zerbrechen", False, ['Destruktive zer-Präfixierung gefunden']),
+    # Überlappende Treffer: zer-Präfix und Kabbala im selben Wort
+    ("zerKabbala", False, ['Kabbala sollte als Qabbala geschrieben werden',
+                           'Destruktive zer-Präfixierung gefunden']),
+    ("Qabbala Kabbala", True, []),
+    ("Qawana", True, []),
+    ("Hallo", True, []),
+])
+def test_validiere_begriff(parser, begriff, gültig, hinweise):
+    validierung = parser.validiere_begriff(begriff)
+
+    assert validierung['gültig'] is gültig
+    assert validierung['hinweise'] == hinweise
+
+
+def test_json_export_nur_bei_aenderung(parser, tmp_path):
+    parser.glossar_path = tmp_path
+    pfad = parser.exportiere_glossar_json()
+    assert json.loads(pfad.read_text(encoding='utf-8'))['statistik'] == parser.statistik
+
+    # Markierung zeigt, ob die Datei neu geschrieben wurde
+    pfad.write_text("unverändert", encoding='utf-8')
+    assert parser.exportiere_glossar_json() == pfad
+    assert pfad.read_text(encoding='utf-8') == "unverändert"
+
+    parser.transformiere(TEXT)
+    parser.exportiere_glossar_json()
+    assert json.loads(pfad.read_text(encoding='utf-8'))['statistik'] == {
+        'transformationen': 1, 'begriffe': 5}
+
+    pfad.unlink()
+    parser.exportiere_glossar_json()
+    assert json.loads(pfad.read_text(encoding='utf-8'))['statistik']['begriffe'] == 5
+
+
+def test_spaet_angelegtes_glossar_wird_erkannt(tmp_path):
+    pfad = tmp_path / "wwaq-tikun-glossar.md"
+    assert not wwaq_parser._glossar_vorhanden(pfad)
+
+    pfad.write_text("# Glossar\n", encoding='utf-8')
+    assert wwaq_parser._glossar_vorhanden(pfad)
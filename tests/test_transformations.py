@@ -0,0 +1,65 @@
+"""Tests für die Glossar-Transformationen des GlossarManagers"""
+import pytest
+
+from src import glossar_manager
+from src.glossar_manager import GlossarManager
+
+
+@pytest.fixture
+def manager(glossar, monkeypatch):
+    """GlossarManager über ein Test-Glossar"""
+    def baue(k_zu_q, zer_elimination=None, automat=True):
+        if not automat:
+            monkeypatch.setattr(glossar_manager, 'ahocorasick', None)
+        glossar(k_zu_q, zer_elimination)
+        return GlossarManager()
+
+    return baue
+
+
+@pytest.fixture(params=[True, False], ids=['automat', 'regex'])
+def automat(request):
+    if request.param and glossar_manager.ahocorasick is None:
+        pytest.skip("pyahocorasick nicht installiert")
+    return request.param
+
+
+@pytest.mark.parametrize("regeln, text, erwartet", [
+    ({'Kabbala': 'Qabbala', 'zerKabbalah': 'X'}, 'zerKabbala', 'zerQabbala'),
+    ({'WWAK': 'WWAQ', 'AWWAKE': 'X'}, 'AWWAK', 'AWWAQ'),
+    ({'Kabbala': 'Qabbala', 'zerKabbalah': 'X'}, 'zerKabbalah Kabbala', 'X Qabbala'),
+])
+def test_ueberlappende_schluessel(manager, automat, regeln, text, erwartet):
+    assert manager(regeln, automat=automat).transform(text) == erwartet
+
+
+def test_laengster_schluessel_zuerst(manager, automat):
+    regeln = {'Kabbala': 'Qabbala', 'Kabbalah': 'Qabbala', 'Kabbalist': 'Qabbalist'}
+    text = "Kabbalah, Kabbalist und Kabbala"
+
+    assert manager(regeln, automat=automat).transform(text) == "Qabbala, Qabbalist und Qabbala"
+
+
+def test_beide_kategorien_in_einem_durchlauf(manager, automat):
+    glossar = manager({'Kabbala': 'Qabbala'},
+                      {'zerbrechen': 'bersten', 'zerbrechen lassen': 'bersten lassen'},
+                      automat=automat)
+    text = "Kabbala: zerbrechen lassen, zerbrechen"
+
+    assert glossar.transform(text) == "Qabbala: bersten lassen, bersten"
+
+
+def test_leere_tabellen(manager, automat):
+    glossar = manager({}, automat=automat)
+
+    # Ein Automat ohne Schlüssel wäre nicht durchsuchbar
+    assert glossar._automat is None
+    assert glossar.transform("Kabbala bleibt") == "Kabbala bleibt"
+
+
+def test_glossar_einmal_pro_prozess(manager):
+    manager({'Kabbala': 'Qabbala'})
+    GlossarManager()
+
+    assert glossar_manager._lade_regeln.cache_info().misses == 1
+    assert glossar_manager._lade_regeln() == (('Kabbala', 'Qabbala'),)
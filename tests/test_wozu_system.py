@@ -0,0 +1,212 @@
+"""Tests für den EchtzeitKommunikator (Batching, Empfang, Wozu-Bericht)"""
+import asyncio
+import importlib.util
+import sys
+import types
+from enum import Enum
+from pathlib import Path
+
+import pytest
+
+BASIS = Path(__file__).parent.parent
+
+
+class Olam(Enum):
+    AZILUT = "אצילות"
+    BERIJA = "בריאה"
+    JEZIRA = "יצירה"
+    ASIJA = "עשייה"
+
+
+class AzilutKonverter:
+    def erkenne_weltebene(self, text):
+        return Olam.JEZIRA
+
+
+class HNS10SpiralTime:
+    def current_spiral_time(self):
+        return {'grad': 1}
+
+
+@pytest.fixture
+def modul(monkeypatch):
+    # Minimale Stellvertreter für die Ez-Chajim-Module, die dieser Baum nicht enthält
+    azilut = types.ModuleType("src.azilut_konverter")
+    azilut.AzilutKonverter, azilut.Olam = AzilutKonverter, Olam
+    spirale = types.ModuleType("src.hns10_spiral_system")
+    spirale.HNS10SpiralTime = HNS10SpiralTime
+    monkeypatch.setitem(sys.modules, "src.azilut_konverter", azilut)
+    monkeypatch.setitem(sys.modules, "src.hns10_spiral_system", spirale)
+    monkeypatch.syspath_prepend(str(BASIS))
+
+    # Dateiname mit Bindestrichen - nur über importlib ladbar
+    spec = importlib.util.spec_from_file_location("ez_chajim_wozu_system",
+                                                  BASIS / "ez-chajim-wozu-system.py")
+    modul = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modul)
+    return modul
+
+
+@pytest.fixture
+def komm(modul, glossar):
+    glossar({'Kabbala': 'Qabbala'})
+    return modul.EchtzeitKommunikator()
+
+
+def _nachricht(modul, nr=0):
+    return modul.EchtzeitNachricht(
+        inhalt=f"Nachricht {nr}",
+        wozu="um zu testen",
+        sender_modul="test-sender",
+        empfänger_modul="test-empfänger",
+        frage_hierarchie={}
+    )
+
+
+def test_voller_batch_wird_sofort_abgegeben(modul, komm):
+    async def lauf():
+        for nr in range(komm.BATCH_GROESSE):
+            komm._einreihen(_nachricht(modul, nr))
+
+    asyncio.run(lauf())
+
+    assert komm.nachrichten_queue.qsize() == 1
+    assert len(komm.nachrichten_queue.get_nowait()) == komm.BATCH_GROESSE
+    assert komm._pending == []
+    assert komm._flush_handle is None
+
+
+def test_unvollstaendiger_batch_nach_intervall(modul, komm):
+    async def lauf():
+        komm._einreihen(_nachricht(modul))
+        assert komm.nachrichten_queue.empty()
+        await asyncio.sleep(komm.BATCH_INTERVALL * 5)
+
+    asyncio.run(lauf())
+
+    assert len(komm.nachrichten_queue.get_nowait()) == 1
+    assert komm._pending == []
+    assert komm._flush_handle is None
+
+
+def test_timer_einer_beendeten_loop(modul, komm):
+    async def erste_loop():
+        # Endet, bevor der Timer feuert
+        komm._einreihen(_nachricht(modul, 1))
+
+    asyncio.run(erste_loop())
+
+    async def zweite_loop():
+        komm._einreihen(_nachricht(modul, 2))
+        await asyncio.sleep(komm.BATCH_INTERVALL * 5)
+
+    asyncio.run(zweite_loop())
+
+    batches = [komm.nachrichten_queue.get_nowait()
+               for _ in range(komm.nachrichten_queue.qsize())]
+    assert [n.inhalt for batch in batches for n in batch] == ["Nachricht 1", "Nachricht 2"]
+    assert komm._pending == []
+
+
+def test_flush_leert_ausstehende(modul, komm):
+    async def lauf():
+        komm._einreihen(_nachricht(modul))
+        await komm.flush()
+
+    asyncio.run(lauf())
+
+    assert len(komm.nachrichten_queue.get_nowait()) == 1
+    assert komm._pending == []
+    assert komm._flush_handle is None
+
+
+def test_empfang_eines_batches(modul, komm):
+    async def lauf():
+        for nr, empfänger in ((1, "a"), (2, "b"), (3, "a")):
+            nachricht = _nachricht(modul, nr)
+            nachricht.empfänger_modul = empfänger
+            komm._einreihen(nachricht)
+        await komm.flush()
+
+        # Ein Batch mit allen drei Nachrichten; das Modul erhält nur seine
+        empfang = komm.empfange_nachrichten("a")
+        erhalten = [await anext(empfang), await anext(empfang)]
+        await empfang.aclose()
+        return erhalten
+
+    erhalten = asyncio.run(lauf())
+
+    assert [n.inhalt for n in erhalten] == ["Nachricht 1", "Nachricht 3"]
+    assert komm.nachrichten_queue.empty()
+
+
+def test_bericht_ohne_nachrichten(komm):
+    bericht = komm.generiere_wozu_bericht([]).splitlines()
+
+    assert "Anzahl Nachrichten: 0" in bericht
+    assert "Azilut-verankert: 0/0 (0.0%)" in bericht
+    assert "Durchschnittlicher Azilut-Score: 0.00" in bericht
+
+
+def test_bericht_mit_unvalidierten_nachrichten(modul, komm):
+    def validiert(nr, score, olam, korrekturen=()):
+        nachricht = _nachricht(modul, nr)
+        nachricht.validierung = modul.WozuValidierung(
+            ist_verankert=score > 0.7,
+            azilut_score=score,
+            fehlende_wozu_aspekte=[],
+            empfohlene_korrekturen=list(korrekturen),
+            weltebene=olam
+        )
+        return nachricht
+
+    nachrichten = [
+        validiert(1, 0.9, Olam.AZILUT),
+        validiert(2, 0.3, Olam.ASIJA, ["Definiere klaren Zweck/Absicht"]),
+        validiert(3, 0.6, Olam.ASIJA, ["Definiere klaren Zweck/Absicht"]),
+        _nachricht(modul, 4),  # ohne Validierung
+    ]
+    bericht = komm.generiere_wozu_bericht(nachrichten).splitlines()
+
+    assert "Azilut-verankert: 1/4 (25.0%)" in bericht
+    # Durchschnitt nur über validierte Nachrichten
+    assert "Durchschnittlicher Azilut-Score: 0.60" in bericht
+    weltebenen = bericht.index("--- WELTEBENEN-VERTEILUNG ---")
+    assert bericht[weltebenen + 1:weltebenen + 3] == ["ASIJA: 2 Nachrichten", "AZILUT: 1 Nachrichten"]
+    assert "• Definiere klaren Zweck/Absicht (2x)" in bericht
+
+
+def test_azilut_score_zaehlt_verschiedene_indikatoren_und_marker(modul):
+    validator = modul.WozuValidator()
+
+    def score(inhalt, wozu):
+        nachricht = _nachricht(modul)
+        nachricht.inhalt, nachricht.wozu = inhalt, wozu
+        indikatoren = {ind.lower() for ind in validator._WOZU_RE.findall(wozu)}
+        return validator._berechne_azilut_score(nachricht, indikatoren)
+
+    # Überlappende Indikatoren ("um zu" / "zur") zählen beide, Groß-/Kleinschreibung egal
+    assert score("", "UM ZUR Vollendung") == pytest.approx(0.5)
+    assert score("", "zur Vollendung") == pytest.approx(0.4)
+    # Marker aus Inhalt und Wozu, jeder nur einmal
+    assert score("Tiqqun", "Tiqqun und Emanation") == pytest.approx(0.6)
+
+
+def test_azilut_marker_nicht_ueber_feldgrenze(modul):
+    nachricht = _nachricht(modul)
+    nachricht.inhalt, nachricht.wozu = "unendliches", " Licht"
+
+    # Der Scan läuft über inhalt + "\x00" + wozu; "unendliches Licht" entsteht nicht
+    assert modul.WozuValidator()._berechne_azilut_score(nachricht, set()) == pytest.approx(0.3)
+
+
+def test_monotone_zeitstempel(modul):
+    from datetime import datetime, timedelta
+
+    erste, zweite = _nachricht(modul, 1), _nachricht(modul, 2)
+
+    assert isinstance(erste.zeitstempel, int)
+    assert erste.zeitstempel <= zweite.zeitstempel
+    # Umrechnung in Wanduhrzeit erst beim Zugriff
+    iso = datetime.fromisoformat(zweite.iso_zeitstempel)
+    assert abs(datetime.now() - iso) < timedelta(seconds=5)